@@ -11,6 +11,8 @@ import lxml.etree
 
 TWINCAT_TYPES = {}
 USE_FILE_AS_PATH = object()
+# Large .tmc files can exceed libxml2's default safety limits
+XML_PARSER = lxml.etree.XMLParser(huge_tree=True)
 
 logger = logging.getLogger(__name__)
 
@@ -424,6 +426,15 @@ class Symbol_FB_DriveVirtual(Symbol):
     @property
     def nc_axis(self):
         'The NC `Axis` associated with the FB_DriveVirtual'
+        try:
+            return self._nc_axis
+        except AttributeError:
+            self._nc_axis = self._find_nc_axis()
+
+        return self._nc_axis
+
+    def _find_nc_axis(self):
+        'Find the NC `Axis` by way of the NcToPlc link'
         link = self.nc_to_plc_link
         parent_name = link.parent.name.split('^')
         if parent_name[0] == 'TINC':
@@ -477,7 +488,14 @@ class POU(_TwincatProjectSubItem):
     @property
     def call_blocks(self):
         'A dictionary of all implementation call blocks'
-        return get_pou_call_blocks(self.declaration, self.implementation)
+        # Looked up once per FB_DriveVirtual; only parse the source once
+        try:
+            return self._call_blocks
+        except AttributeError:
+            self._call_blocks = get_pou_call_blocks(self.declaration,
+                                                    self.implementation)
+
+        return self._call_blocks
 
     @property
     def program_name(self):
@@ -947,8 +965,8 @@ def parse(fn, *, parent=None):
     '''
     fn = case_insensitive_path(fn)
 
-    with open(fn, 'rt') as f:
-        tree = lxml.etree.parse(f)
+    # Let libxml2 read the file directly, rather than through a Python file
+    tree = lxml.etree.parse(str(fn), parser=XML_PARSER)
 
     root = tree.getroot()
     return TwincatItem.parse(root, filename=fn, parent=parent)
@@ -6,17 +6,55 @@ Relies on the existence (and linking) of FB_DriveVirtual function blocks.
 """
 
 import argparse
+import collections
+import functools
 import getpass
 import logging
 import pathlib
 
-import jinja2
-
 from .parse import load_project, Symbol_FB_DriveVirtual
 
 
 description = __doc__
 
+# Per-motor information made available to st.cmd templates as `motors`
+TemplateMotor = collections.namedtuple(
+    'TemplateMotor',
+    'axisconfig name axis_no desc egu prec additional_fields'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_jinja_env():
+    '''
+    The shared Jinja2 environment
+
+    Created (and jinja2 imported) on first use only, so that ``--help`` and
+    argument parsing do not pay for it.
+    '''
+    import jinja2
+    return jinja2.Environment(
+        loader=jinja2.PackageLoader("tcparse", "templates"),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=400,
+        # Reuse compiled template code across invocations of tcparse-stcmd
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _get_template(name):
+    'Load (and compile) a template from the shared environment only once'
+    return get_jinja_env().get_template(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_user():
+    'The current user name, looked up once per process'
+    return getpass.getuser()
+
 
 def build_arg_parser():
     parser = argparse.ArgumentParser(
@@ -75,50 +113,50 @@ def run(args):
     logger.setLevel(args.log)
     logging.basicConfig()
 
-    jinja_env = jinja2.Environment(
-        loader=jinja2.PackageLoader("tcparse", "templates"),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-
     if not args.name:
         args.name = pathlib.Path(args.tsproj_project).stem
 
     if not args.prefix:
         args.prefix = args.name.upper()
 
-    template = jinja_env.get_template(args.template)
+    template = _get_template(args.template)
 
     project = load_project(args.tsproj_project)
-    motors = [(motor, motor.nc_axis)
-              for motor in project.find(Symbol_FB_DriveVirtual)]
+
+    delim_table = str.maketrans({' ': args.delim, '_': args.delim})
 
     def get_name(nc_axis):
-        name = nc_axis.short_name
-        name = name.replace(' ', args.delim)
-        return name.replace('_', args.delim)
-
-    template_motors = [
-        dict(axisconfig='',
-             name=get_name(nc_axis),
-             axis_no=nc_axis.axis_number,
-             desc=f'{motor.name} / {nc_axis.short_name}',
-             egu=nc_axis.units,
-             prec=3,
-             additional_fields='',
-             )
-        for motor, nc_axis in motors
-    ]
+        return nc_axis.short_name.translate(delim_table)
+
+    # Build the template information in a single pass over the motors
+    first_motor = None
+    template_motors = []
+    for motor in project.find(Symbol_FB_DriveVirtual):
+        if first_motor is None:
+            first_motor = motor
+
+        nc_axis = motor.nc_axis
+        template_motors.append(
+            TemplateMotor(axisconfig='',
+                          name=get_name(nc_axis),
+                          axis_no=nc_axis.axis_number,
+                          desc=f'{motor.name} / {nc_axis.short_name}',
+                          egu=nc_axis.units,
+                          prec=3,
+                          additional_fields='',
+                          )
+        )
 
     # TODO: for now, only support a single virtual PLC for all motors
-    ads_port = motors[0][0].module.ads_port if motors else 851
+    ads_port = (first_motor.module.ads_port if first_motor is not None
+                else 851)
 
     template_args = dict(
         binary_name=args.binary,
         name=args.name,
         prefix=args.prefix,
         delim=args.delim,
-        user=getpass.getuser(),
+        user=_get_user(),
 
         motor_port='PLC_ADS',
         asyn_port='ASYN_PLC',
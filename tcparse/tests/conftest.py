@@ -1,3 +1,4 @@
+import os
 import pytest
 import pathlib
 
@@ -7,11 +8,25 @@ from .. import load_project
 TEST_ROOT = pathlib.Path(__file__).parent
 
 
-@pytest.fixture(params=list(str(fn) for fn in TEST_ROOT.glob('**/*.tsproj')))
+def _find_projects(path):
+    'Recursively yield all .tsproj filenames under `path`'
+    with os.scandir(path) as it:
+        for entry in it:
+            # Like pathlib's '**' glob, do not recurse into symlinked dirs
+            if entry.is_dir(follow_symlinks=False):
+                yield from _find_projects(entry.path)
+            elif entry.name.endswith('.tsproj'):
+                yield entry.path
+
+
+_PROJECTS = tuple(sorted(_find_projects(TEST_ROOT)))
+
+
+@pytest.fixture(scope='session', params=_PROJECTS)
 def project_filename(request):
     return request.param
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def project(project_filename):
     return load_project(project_filename)
@@ -1,5 +1,83 @@
+import types
+
+import pytest
+
+from .. import stcmd
 from ..stcmd import main as stcmd_main
 
 
 def test_stcmd(project_filename):
     print(stcmd_main(cmdline_args=[project_filename]))
+
+
+def _stub_motor(motor_name, axis_name, axis_number, *, ads_port=852):
+    'A stand-in for Symbol_FB_DriveVirtual, with only what stcmd uses'
+    nc_axis = types.SimpleNamespace(short_name=axis_name,
+                                    axis_number=axis_number, units='deg')
+    module = types.SimpleNamespace(ads_port=ads_port)
+    return types.SimpleNamespace(name=motor_name, nc_axis=nc_axis,
+                                 module=module)
+
+
+class _StubProject:
+    ams_id = '1.2.3.4.1.1'
+    target_ip = '1.2.3.4'
+
+    def __init__(self, motors):
+        self.motors = motors
+
+    def find(self, cls):
+        yield from self.motors
+
+
+def _render_stub(monkeypatch, motors, *args):
+    'Render an st.cmd for a stub project, returning the epicsEnvSet values'
+    project = _StubProject(motors)
+    monkeypatch.setattr(stcmd, 'load_project', lambda fn: project)
+    rendered = stcmd_main(cmdline_args=['stub.tsproj', *args])
+    env = {}
+    for line in rendered.splitlines():
+        if line.startswith('epicsEnvSet('):
+            key, value = line[len('epicsEnvSet('):].rstrip(' )').split(',', 1)
+            env.setdefault(key.strip(' "'), []).append(value.strip(' "'))
+    return env
+
+
+@pytest.mark.parametrize(
+    'motors, num_axes, ads_port',
+    [pytest.param([], '0', '851', id='no_motors'),
+     pytest.param([_stub_motor('Main.M1', 'Axis 1', '1'),
+                   _stub_motor('Main.M2', 'Axis 2', '2')],
+                  '2', '852', id='two_motors'),
+     ]
+)
+def test_stcmd_stub_project(monkeypatch, motors, num_axes, ads_port):
+    env = _render_stub(monkeypatch, motors)
+    assert env['NUMAXES'] == [num_axes]
+    assert env['IPPORT'] == [ads_port]
+    assert env['IPADDR'] == ['1.2.3.4']
+    assert len(env.get('MOTOR_NAME', [])) == len(motors)
+
+
+@pytest.mark.parametrize(
+    'delim, expected',
+    [pytest.param(None, ['Axis:1:X', 'Stage:Y'], id='default'),
+     pytest.param('-', ['Axis-1-X', 'Stage-Y'], id='dash'),
+     ]
+)
+def test_stcmd_motor_name_delimiter(monkeypatch, delim, expected):
+    motors = [_stub_motor('Main.M1', 'Axis 1_X', '1'),
+              _stub_motor('Main.M2', 'Stage_Y', '2')]
+    args = ['--delim', delim] if delim is not None else []
+    env = _render_stub(monkeypatch, motors, *args)
+    assert env['MOTOR_NAME'] == expected
+
+
+def test_stcmd_template_motor_fields(monkeypatch):
+    env = _render_stub(monkeypatch, [_stub_motor('Main.M1', 'Axis 1', '3')])
+    assert env['AXIS_NO'] == ['3']
+    assert env['DESC'] == ['Main.M1 / Axis 1']
+    assert env['EGU'] == ['deg']
+    assert env['PREC'] == ['3']
+    assert env['AXISCONFIG'] == ['']
+    assert env['ECAXISFIELDINIT'] == ['']
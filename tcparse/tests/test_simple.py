@@ -1,6 +1,10 @@
+import lxml.etree
+import pytest
+
 from .conftest import TEST_ROOT
 
-from ..parse import get_pou_call_blocks, parse
+from ..parse import (get_pou_call_blocks, parse, Symbol_FB_DriveVirtual,
+                     TwincatItem)
 
 
 def test_call_blocks():
@@ -36,6 +40,83 @@ def test_call_blocks():
     }
 
 
+@pytest.mark.parametrize(
+    'impl',
+    [pytest.param('''
+        IF bReady AND
+           F_Check(nState) THEN
+            M1(En := TRUE, Axis := M1Link.axis);
+        END_IF
+     ''', id='multiline_condition'),
+     pytest.param('''
+        ADSLOGSTR(ADSLOG_MSGTYPE_HINT, 'Starting', '')
+        M1(En := TRUE, Axis := M1Link.axis);
+     ''', id='undeclared_call'),
+     ]
+)
+def test_call_blocks_undeclared_calls(impl):
+    decl = '''
+        PROGRAM Main
+        VAR
+                M1: FB_DriveVirtual;
+                M1Link: FB_NcAxis;
+                bReady: BOOL;
+                nState: INT;
+        END_VAR
+    '''
+
+    assert get_pou_call_blocks(decl, impl) == {
+        'M1': {'En': 'TRUE',
+               'Axis': 'M1Link.axis'},
+    }
+
+
+def test_pou_call_blocks_cached():
+    pou = TwincatItem.parse(lxml.etree.fromstring('''
+        <POU Name="Main">
+            <Declaration><![CDATA[PROGRAM Main
+VAR
+    M1: FB_DriveVirtual;
+    M1Link: FB_NcAxis;
+END_VAR
+]]></Declaration>
+            <Implementation>
+                <ST><![CDATA[M1Link(En := TRUE);
+M1(En := TRUE, Axis := M1Link.axis);
+]]></ST>
+            </Implementation>
+        </POU>
+    '''))
+
+    call_blocks = pou.call_blocks
+    assert call_blocks == {
+        'M1': {'En': 'TRUE', 'Axis': 'M1Link.axis'},
+        'M1Link': {'En': 'TRUE'},
+    }
+    assert pou.call_blocks is call_blocks
+
+
+def test_nc_axis_cached(monkeypatch):
+    motor = TwincatItem.parse(lxml.etree.fromstring('''
+        <Symbol>
+            <Name>Main.M1</Name>
+            <BaseType>FB_DriveVirtual</BaseType>
+        </Symbol>
+    '''))
+    assert isinstance(motor, Symbol_FB_DriveVirtual)
+
+    lookups = []
+
+    def find_nc_axis(self):
+        lookups.append(self)
+        return object()
+
+    monkeypatch.setattr(Symbol_FB_DriveVirtual, '_find_nc_axis', find_nc_axis)
+    nc_axis = motor.nc_axis
+    assert motor.nc_axis is nc_axis
+    assert lookups == [motor]
+
+
 def test_route_parsing():
     # located in: C:\twincat\3.1\StaticRoutes.xml
     routes = parse(TEST_ROOT / 'static_routes.xml')